@@ -2,8 +2,10 @@
 imports added so users do not have to think about submodules
 """
 
-from .core import SaturnConnection  # noqa: F401
+from .core import SaturnConnection
 from ._version import get_versions
 
 __version__ = get_versions()["version"]
 del get_versions
+
+__all__ = ["SaturnConnection", "__version__"]
@@ -0,0 +1,117 @@
+"""
+Caching used to avoid repeating identical API requests
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from tempfile import NamedTemporaryFile
+from typing import Any, Hashable, List, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Bounded mapping whose entries expire ttl seconds after they are set.
+
+    Once maxsize entries are stored, the least recently used entry is evicted.
+    Safe to share between threads.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def keys(self) -> List[Hashable]:
+        with self._lock:
+            return list(self._data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+def cache_dir() -> str:
+    """Directory for caches that persist across processes"""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "saturn-client")
+
+
+def read_disk_cache(name: str) -> Optional[Tuple[Any, float]]:
+    """
+    Returns the JSON value stored under name and its age in seconds, so callers can
+    decide whether to use or revalidate it. Any problem reading the cache is a miss.
+    """
+    path = os.path.join(cache_dir(), f"{name}.json")
+    try:
+        age = time.time() - os.path.getmtime(path)
+        with open(path, "r") as f:
+            return json.load(f), age
+    except (OSError, ValueError):
+        return None
+
+
+def write_disk_cache(name: str, value: Any) -> None:
+    """
+    Atomically stores a JSON value under name. The cache is best effort,
+    so failures (e.g. a read-only home directory) are ignored.
+    """
+    directory = cache_dir()
+    tmp_path = None
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with NamedTemporaryFile("w", dir=directory, suffix=".tmp", delete=False) as f:
+            tmp_path = f.name
+            json.dump(value, f)
+        os.replace(tmp_path, os.path.join(directory, f"{name}.json"))
+    except (OSError, TypeError, ValueError):
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def prune_disk_cache(prefix: str, max_age: float) -> None:
+    """
+    Removes entries whose name starts with prefix and that weren't written in the last
+    max_age seconds, e.g. ones keyed on a token that has since been refreshed.
+    """
+    directory = cache_dir()
+    now = time.time()
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return
+    for name in names:
+        if not (name.startswith(prefix) and name.endswith(".json")):
+            continue
+        path = os.path.join(directory, name)
+        try:
+            if now - os.path.getmtime(path) > max_age:
+                os.remove(path)
+        except OSError:
+            pass
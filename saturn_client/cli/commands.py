@@ -29,13 +29,6 @@ from saturn_client.core import (
 )
 
 
-logging.basicConfig(level=logging.DEBUG)
-logging.getLogger("fsspec.generic").setLevel(logging.DEBUG)
-logging.getLogger("fsspec").setLevel(logging.DEBUG)
-logging.getLogger("fsspec.local").setLevel(logging.DEBUG)
-logging.getLogger("saturnfs.client.saturnfs").setLevel(logging.DEBUG)
-
-
 @click.group()
 def cli():
     pass
@@ -609,7 +602,24 @@ def split_cli(
         yaml.dump(recipe, f)
 
 
+def _configure_cli_logging():
+    """
+    Logging for the sc command. Done here rather than at import so that importing
+    the CLI module doesn't reconfigure logging for the importing application.
+    """
+    logging.basicConfig(level=logging.DEBUG)
+    logging.getLogger("fsspec.generic").setLevel(logging.DEBUG)
+    logging.getLogger("fsspec").setLevel(logging.DEBUG)
+    logging.getLogger("fsspec.local").setLevel(logging.DEBUG)
+    logging.getLogger("saturnfs.client.saturnfs").setLevel(logging.DEBUG)
+
+
 def entrypoint():
+    _configure_cli_logging()
+    if hasattr(sys.stdout, "reconfigure") and not sys.stdout.isatty():
+        # Under a job, stdout is a pipe to the log collector; emit whole lines promptly
+        # instead of in 8 KiB blocks, so messages interleave sensibly with run output
+        sys.stdout.reconfigure(line_buffering=True)
     try:
         cli(max_content_width=100)
     except SaturnHTTPError as e:
@@ -4,35 +4,60 @@ NOTE: This is an experimental library and will likely change in
 the future
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from fnmatch import fnmatch
-from json import JSONDecodeError
 import logging
 import datetime as dt
+import hashlib
 from dataclasses import dataclass, asdict
-from functools import reduce
-from os.path import join
-from tempfile import TemporaryDirectory
+from itertools import chain
+from operator import itemgetter
+import threading
+import time
 import weakref
 
 import requests
-from typing import Any, Dict, Iterable, List, Optional, Union, Generator
-from urllib.parse import urljoin, urlencode
+from typing import AbstractSet, Any, Dict, Iterable, List, Optional, Tuple, Union, Generator
+from urllib.parse import quote, quote_plus, urljoin, urlencode
 
 from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from saturn_client.logs import format_historical_logs, format_logs, is_live
 
+from .cache import TTLCache, prune_disk_cache, read_disk_cache, write_disk_cache
 from .settings import Settings
 from .tar_utils import create_tar_archive
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    # orjson is an optional, faster drop-in for decoding API responses
+    from json import loads as _loads
+
 log = logging.getLogger("saturn-client")
-if log.level == logging.NOTSET:
-    logging.basicConfig()
-    log.setLevel(logging.INFO)
+# Importing the library doesn't configure logging; that's left to the application
+log.addHandler(logging.NullHandler())
+
+# Seconds that GET responses are reused before going back to the API
+RESOURCE_CACHE_TTL = 5.0
+POD_LIST_CACHE_TTL = 2.0
+POD_SUMMARY_CACHE_TTL = 1.0
+# Seconds an ETag and its raw body are kept for conditional requests. Pod runtime
+# summaries skip this, since they carry full container logs and change constantly.
+ETAG_CACHE_TTL = 3600.0
+# Seconds server status and options are reused across processes from the on-disk cache
+SERVER_INFO_CACHE_TTL = 3600.0
+# Seconds before an unused server info entry (e.g. one for a since-refreshed token) is deleted
+SERVER_INFO_CACHE_MAX_AGE = 86400.0
+# Worker threads shared by a connection for fanning out independent requests
+EXECUTOR_MAX_WORKERS = 8
 
 
 def utcnow() -> str:
-    return dt.datetime.now(tz=dt.timezone.utc).isoformat()
+    """Current UTC time as an ISO 8601 string with seconds precision"""
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
 
 
 class SaturnError(Exception):
@@ -48,8 +73,8 @@ class SaturnHTTPError(SaturnError):
     @classmethod
     def from_response(cls, response: requests.Response):
         try:
-            error = response.json()
-        except JSONDecodeError:
+            error = _loads(response.content)
+        except ValueError:
             error = response.reason
         return cls(error, response.status_code)
 
@@ -64,6 +89,12 @@ class ResourceType:
     JOB = "job"
     WORKSPACE = "workspace"
 
+    # Built once since lookup runs on nearly every request
+    _VALUES = frozenset({DEPLOYMENT, JOB, WORKSPACE})
+    _URL_NAMES = {value: value + "s" for value in _VALUES}
+    # Accepted spellings (singular or plural) mapped to the resource type
+    _LOOKUP = {**{value: value for value in _VALUES}, **{v: k for k, v in _URL_NAMES.items()}}
+
     @classmethod
     def values(cls) -> List[str]:
         return [cls.DEPLOYMENT, cls.JOB, cls.WORKSPACE]
@@ -74,20 +105,14 @@ class ResourceType:
         converts from the name of the resource type to the string we use in the urls. Currently
         this is just the lower case value + plural.
         """
-        return cls.lookup(resource_type) + "s"
+        return cls._URL_NAMES[cls.lookup(resource_type)]
 
     @classmethod
     def lookup(cls, value: str):
-        types = set(cls.values())
-        resource_type = value.lower()
-        if resource_type in types:
-            return resource_type
-        if resource_type.endswith("s"):
-            # Check if value was pluralized
-            resource_type = resource_type[:-1]
-            if resource_type in types:
-                return resource_type
-        raise SaturnError(f'resource type "{value}" not found')
+        resource_type = cls._LOOKUP.get(value.lower())
+        if resource_type is None:
+            raise SaturnError(f'resource type "{value}" not found')
+        return resource_type
 
 
 class ServerOptionTypes:
@@ -124,25 +149,54 @@ class DataSource:
     LIVE = "live"
     HISTORICAL = "historical"
 
+    _VALUES = frozenset({LIVE, HISTORICAL})
+
     @classmethod
     def values(cls) -> List[str]:
         return [cls.LIVE, cls.HISTORICAL]
 
     @classmethod
     def lookup(cls, value: str) -> str:
-        sources = set(cls.values())
         source = value.lower()
-        if source in sources:
+        if source in cls._VALUES:
             return source
         raise SaturnError(f'Pod source "{value}" not found')
 
 
-@dataclass
-class Resource:
+class _FrozenSlots:
+    """
+    Pickle and copy support for frozen dataclasses that declare __slots__, matching what
+    dataclass(slots=True) generates. The default slot restore uses setattr, which a
+    frozen dataclass rejects.
+    """
+
+    __slots__ = ()
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+@dataclass(frozen=True)
+class Resource(_FrozenSlots):
     """
     Captures information about a resource that we care about in the client and CLI
     """
 
+    # Declared by hand since dataclass(slots=True) requires Python 3.10
+    __slots__ = (
+        "owner",
+        "name",
+        "resource_type",
+        "status",
+        "instance_type",
+        "instance_count",
+        "id",
+    )
+
     owner: str
     name: str
     resource_type: str
@@ -153,8 +207,8 @@ class Resource:
     id: str
 
     @classmethod
-    def from_dict(cls, **kwargs: Union[str, int]):
-        cls(
+    def from_dict(cls, **kwargs: Union[str, int]) -> "Resource":
+        return cls(
             owner=kwargs["owner"],
             name=kwargs["name"],
             resource_type=kwargs["resource_type"],
@@ -165,12 +219,14 @@ class Resource:
         )
 
 
-@dataclass
-class Pod:
+@dataclass(frozen=True)
+class Pod(_FrozenSlots):
     """
     Captures information about a pod that we care about in the client and CLI
     """
 
+    __slots__ = ("name", "status", "source", "start_time", "end_time")
+
     name: str
     status: str
     source: str
@@ -178,13 +234,14 @@ class Pod:
     end_time: Optional[str]
 
     @classmethod
-    def from_dict(self, input_dict: Dict[str, Optional[str]]):
-        Pod(
-            name=input_dict["name"],
+    def from_dict(cls, input_dict: Dict[str, Optional[str]]) -> "Pod":
+        """Build a Pod from a get_pods row, which stores the name as pod_name"""
+        return cls(
+            name=input_dict["pod_name"] if "pod_name" in input_dict else input_dict["name"],
             status=input_dict["status"],
             source=input_dict["source"],
-            start_time=input_dict["start_time"],
-            end_time=input_dict["end_time"],
+            start_time=input_dict.get("start_time"),
+            end_time=input_dict.get("end_time"),
         )
 
 
@@ -244,23 +301,26 @@ def execute_request(
     """
     returns the JSON response as a dict.
     """
-    if session is None:
-        session = Session()
-    headers = {}
     if not base_url.endswith("/"):
         base_url += "/"
     if path.startswith("/"):
         path = path[1:]
     url = f"{base_url}{path}"
-    kwargs = dict(headers=headers)
+    # Auth headers live on the session, so none are passed per request
+    kwargs = {}
     if json:
         kwargs["json"] = json
 
-    result = getattr(session, method.lower())(url, **kwargs)
+    if session is None:
+        # Without a shared session, don't leave this one-off connection pool open
+        with Session() as one_off_session:
+            result = getattr(one_off_session, method.lower())(url, **kwargs)
+    else:
+        result = getattr(session, method.lower())(url, **kwargs)
     if result.status_code == 404:
         raise SaturnHTTPError(f"{url}:404")
     if parse_response:
-        result = result.json()
+        result = _loads(result.content)
     return result
 
 
@@ -292,6 +352,26 @@ def make_path(path: str, query_dict: dict) -> str:
     return path
 
 
+def _historical_pod_key(pod: Dict[str, Any]) -> Tuple[str, str]:
+    # History rows may have a null start_time, which can't be compared with strings
+    return (pod["start_time"] or "", pod["pod_name"])
+
+
+# Live start times are always strings, so the key can be extracted in C
+_live_pod_key = itemgetter("start_time", "pod_name")
+
+
+def status_set(status: Union[str, Iterable[str]]) -> AbstractSet[str]:
+    """
+    normalizes a status filter to a set so membership checks are O(1)
+    """
+    if isinstance(status, str):
+        return {status}
+    if isinstance(status, (set, frozenset)):
+        return status
+    return set(status)
+
+
 class SaturnConnection:
     """
     Create a ``SaturnConnection`` to interact with the API.
@@ -306,13 +386,16 @@ class SaturnConnection:
     :param refresh_token: API refresh token to re-authenticate an expired api_token.
     """
 
-    _options = None
+    _version = None
+    _orgs = None
+    _current_user = None
 
     def __init__(
         self,
         url: Optional[str] = None,
         api_token: Optional[str] = None,
         refresh_token: Optional[str] = None,
+        check_connection: bool = True,
     ):
         """
         Create a ``SaturnConnection`` to interact with the API.
@@ -320,13 +403,28 @@ class SaturnConnection:
         :param url: URL for the SaturnCloud instance.
             Example: "https://app.community.saturnenterprise.io"
         :param api_token: API token for authenticating the request to Saturn API.
+        :param check_connection: Look up the Saturn version on construction. The version
+            comes from the on-disk server info cache when this server was reached within
+            the last hour, so a request (and any connection or auth error) only happens
+            here when that cache is missing or stale. When False, nothing is looked up
+            until the connection is first used.
         """
         self.settings = Settings(url, api_token, refresh_token)
         self.session = SaturnSession(self.settings)
-        weakref.finalize(self, self.close)
-
-        # test connection to raise errors early
-        self._saturn_version = self._get_saturn_version()
+        # Joined once so request paths can be built with plain string formatting
+        self._api_base = urljoin(self.url, "api/")
+        self._cache = TTLCache()
+        self._etags = TTLCache()
+        # Bumped on invalidation so responses fetched before a mutation are not stored
+        self._cache_version = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        # Finalize on the session itself; a bound self.close would keep this object alive forever
+        weakref.finalize(self, self.session.close)
+
+        if check_connection:
+            # test connection to raise errors early, unless this server was probed recently
+            self._saturn_version
 
     def __enter__(self):
         return self
@@ -336,6 +434,31 @@ class SaturnConnection:
 
     def close(self):
         self.session.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Thread pool shared by this connection's concurrent fetches, created on first use
+        so threads are only started once and only when needed.
+        """
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=EXECUTOR_MAX_WORKERS, thread_name_prefix="saturn-client"
+                    )
+        return self._executor
+
+    def _request(self, method: str, url: str, **kwargs) -> Any:
+        """
+        Send a request on the pooled session and decode the JSON body.
+        Error responses are raised by the session before any decoding happens.
+        """
+        response = self.session.request(method, url, **kwargs)
+        return _loads(response.content)
 
     def create_usage_limit(self, limit: UsageLimitCreate) -> UsageLimit:
         path = "/api/limits"
@@ -446,8 +569,11 @@ class SaturnConnection:
         path = f"/api/service_accounts/{service_account_id}/associate/{identity_type}/{identity_id}"
         return execute_request(self.session, self.settings.BASE_URL, path, method="PUT")
 
-    def get_all_users(self, org_id: Optional[str] = None, details: bool = False) -> List[str]:
-        params = {"page_size": "1", "details": details}
+    def get_all_users(
+        self, org_id: Optional[str] = None, details: bool = False, page_size: int = 100
+    ) -> List[str]:
+        # Each page is a round trip, so fetch users in large pages
+        params = {"page_size": str(page_size), "details": details}
         if org_id:
             params["org_id"] = org_id
         route = make_path("/api/users", params)
@@ -472,8 +598,9 @@ class SaturnConnection:
     ) -> Dict:
         if owner_name is None:
             owner_name = f"{self.primary_org['name']}/{self.current_user['username']}"
-        url = urljoin(self.url, "api/shared_folders")
-        response = self.session.post(
+        url = f"{self._api_base}shared_folders"
+        return self._request(
+            "POST",
             url,
             json={
                 "owner_name": owner_name,
@@ -484,34 +611,34 @@ class SaturnConnection:
                 "disk_space": "100Gi",
             },
         )
-        return response.json()
 
     def delete_shared_folder(self, shared_folder_id: str) -> Dict:
-        url = urljoin(self.url, f"api/shared_folders/{shared_folder_id}")
-        response = self.session.delete(url)
-        return response.json()
+        url = f"{self._api_base}shared_folders/{shared_folder_id}"
+        return self._request("DELETE", url)
 
     def set_preferred_org(self, user_id: str, org_id: str) -> Dict:
-        url = urljoin(self.url, "api/user/preferences")
-        response = self.session.post(url, json={"user_id": user_id, "default_org_id": org_id})
-        return response.json()
+        url = f"{self._api_base}user/preferences"
+        result = self._request("POST", url, json={"user_id": user_id, "default_org_id": org_id})
+        self.invalidate_user_cache()
+        return result
 
     def get_size(self, size: str) -> Dict:
-        sizes = self.list_options(ServerOptionTypes.SIZES)
-        pruned = [x for x in sizes if x["name"] == size]
-        return pruned[0]
+        # Scan the cached options directly; list_options would copy and sort every size first
+        for option in self.options[ServerOptionTypes.SIZES].values():
+            if option["name"] == size:
+                return option
+        names = sorted(x["name"] for x in self.options[ServerOptionTypes.SIZES].values())
+        raise IndexError(f'size "{size}" not found. Options are: {", ".join(names)}')
 
     def list_options(self, option_type: str, glob: Optional[str] = None) -> List:
         if option_type not in ServerOptionTypes.values():
             raise ValueError(
                 f"unknown option {option_type}. must be one of {ServerOptionTypes.values()}"
             )
-        url = urljoin(self.url, "api/info/servers")
-        response = self.session.get(url)
-        results = response.json()[option_type]
+        results = self.options[option_type]
         if option_type != ServerOptionTypes.SIZES:
-            if glob:
-                results = [x for x in results if fnmatch(x, glob)]
+            # copy so callers can't mutate the cached options
+            results = [x for x in results if not glob or fnmatch(x, glob)]
         else:
             results = results.values()
             if glob:
@@ -521,9 +648,11 @@ class SaturnConnection:
 
     @property
     def orgs(self) -> List[Dict[str, Any]]:
-        url = urljoin(self.url, "api/orgs")
-        response = self.session.get(url)
-        return response.json()["orgs"]
+        """Orgs of the current user, fetched once per connection"""
+        if self._orgs is None:
+            url = f"{self._api_base}orgs"
+            self._orgs = self._request("GET", url)["orgs"]
+        return self._orgs
 
     @property
     def primary_org(self) -> Dict[str, Any]:
@@ -546,49 +675,103 @@ class SaturnConnection:
         username = self.current_user["username"]
         org_name = self.primary_org["name"]
         sfs_path = f"sfs://{org_name}/{username}/{resource_name}{saturn_resource_path}data.tar.gz"
-        with TemporaryDirectory() as d:
-            output_path = join(d, "data.tar.gz")
-            create_tar_archive(
-                local_path,
-                output_path,
-                exclude_globs=[
-                    "*.git/*",
-                    "*.idea/*",
-                    "*.mypy_cache/*",
-                    "*.pytest_cache/*",
-                    "*/__pycache__/*",
-                    "*/.ipynb_checkpoints/*",
-                ],
-            )
-            fs = SaturnFS()
-            fs.put(output_path, sfs_path)
+        fs = SaturnFS()
+        # Stream the archive straight into the upload instead of staging it on local disk.
+        # The upload is only committed once the archive is complete, so a failure partway
+        # leaves any previous archive at sfs_path in place.
+        f = fs.open(sfs_path, "wb", autocommit=False)
+        try:
+            with f:
+                create_tar_archive(
+                    local_path,
+                    f,
+                    exclude_globs=[
+                        "*.git/*",
+                        "*.idea/*",
+                        "*.mypy_cache/*",
+                        "*.pytest_cache/*",
+                        "*/__pycache__/*",
+                        "*/.ipynb_checkpoints/*",
+                    ],
+                )
+        except BaseException:
+            f.discard()
+            raise
+        f.commit()
         return sfs_path
 
     @property
     def current_user(self):
-        url = urljoin(self.url, "api/user")
-        response = self.session.get(url)
-        return response.json()
+        """Identity of the API token, fetched once per connection"""
+        if self._current_user is None:
+            url = f"{self._api_base}user"
+            self._current_user = self._request("GET", url)
+        return self._current_user
+
+    def invalidate_user_cache(self) -> None:
+        """Forget the cached current_user and orgs, e.g. after switching tokens"""
+        self._current_user = None
+        self._orgs = None
 
     @property
     def url(self) -> str:
         """URL of Saturn instance"""
         return self.settings.url
 
+    @property
+    def _saturn_version(self) -> str:
+        """Version of Saturn, fetched on first use"""
+        if self._version is None:
+            self._version = self._get_saturn_version()
+        return self._version
+
     def _get_saturn_version(self) -> str:
         """Get version of Saturn"""
-        url = urljoin(self.url, "api/status")
-        response = self.session.get(url)
-        return response.json()["version"]
+        return self._get_server_info("status")["version"]
 
     @property
     def options(self) -> Dict[str, Any]:
-        """Options for various settings"""
-        if self._options is None:
-            url = urljoin(self.url, "api/info/servers")
-            response = self.session.get(url)
-            self._options = response.json()
-        return self._options
+        """Options for various settings, refreshed once SERVER_INFO_CACHE_TTL has passed"""
+        key = f"{self._api_base}info/servers"
+        options = self._cache.get(key)
+        if options is None:
+            options = self._get_server_info("info/servers")
+            self._cache.set(key, options, SERVER_INFO_CACHE_TTL)
+        return options
+
+    def _get_server_info(self, path: str) -> Dict[str, Any]:
+        """
+        GET a rarely changing endpoint, reusing a recent response from the on-disk cache.
+        Once an entry expires it is revalidated with its ETag, so an unchanged response
+        costs a 304 instead of a full body. Entries are keyed on URL and token so different
+        identities never share them, and ones unused for SERVER_INFO_CACHE_MAX_AGE are pruned.
+        """
+        url = f"{self._api_base}{path}"
+        identity = f"{url}\n{self.settings.SATURN_TOKEN}"
+        cache_name = "server-info-" + hashlib.sha256(identity.encode()).hexdigest()[:32]
+        entry = None
+        cached = read_disk_cache(cache_name)
+        if cached is not None and isinstance(cached[0], dict) and "body" in cached[0]:
+            entry, age = cached
+            if age <= SERVER_INFO_CACHE_TTL:
+                return entry["body"]
+
+        # Only the conditional header is passed; auth headers already live on the session
+        headers = None
+        if entry is not None and entry.get("etag"):
+            headers = {"If-None-Match": entry["etag"]}
+        response = self.session.get(url, headers=headers)
+        etag = response.headers.get("ETag")
+        if response.status_code == 304 and headers:
+            result = entry["body"]
+            etag = etag or entry["etag"]
+        else:
+            result = _loads(response.content)
+        # Rewriting also renews the entry's age after a successful revalidation
+        write_disk_cache(cache_name, {"etag": etag, "body": result})
+        # Every token refresh starts new entries, so drop the ones nothing has used lately
+        prune_disk_cache("server-info-", SERVER_INFO_CACHE_MAX_AGE)
+        return result
 
     def list_resources(
         self,
@@ -598,7 +781,6 @@ class SaturnConnection:
         as_template: bool = False,
         status: Optional[Union[str, Iterable[str]]] = None,
     ) -> List[Dict[str, Any]]:
-        next_last_key = None
         recipes = []
         qparams = {}
         if resource_type is not None:
@@ -610,25 +792,51 @@ class SaturnConnection:
             qparams["name"] = resource_name
         if as_template:
             qparams["as_template"] = True
-        base_url = urljoin(self.url, "api/recipes")
+        if status:
+            status = status_set(status)
+
+        # Only last_key changes between pages, so the rest of the query is encoded once
+        base_url = make_path(f"{self._api_base}recipes", qparams)
+        separator = "&" if qparams else "?"
+        url = base_url
         while True:
-            url = base_url + "?" + urlencode(qparams)
-            response = self.session.get(url)
-            data = response.json()
-            recipes.extend(data["recipes"])
+            # Revalidated with If-None-Match, so unchanged pages come back as an empty 304
+            data = self._conditional_get(url)
+            page = data["recipes"]
+            if status:
+                # Filter as pages arrive so unmatched recipes are not held for the whole listing
+                page = [r for r in page if "state" in r and r["state"].get("status") in status]
+            recipes.extend(page)
             next_last_key = data.get("next_last_key", None)
             if next_last_key is None:
                 break
-            qparams["last_key"] = next_last_key
-
-        if status:
-            if isinstance(status, str):
-                status = {status}
-            elif not isinstance(status, set):
-                status = set(status)
-            recipes = [r for r in recipes if r.get("state", {}).get("status") in status]
+            url = f"{base_url}{separator}last_key={quote_plus(str(next_last_key))}"
         return recipes
 
+    def list_all(
+        self,
+        resource_name: Optional[str] = None,
+        owner_name: Optional[str] = None,
+        as_template: bool = False,
+        status: Optional[Union[str, Iterable[str]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List resources of every type, paginating through each type concurrently.
+        Results are grouped by type in the order of ResourceType.values().
+        """
+        futures = [
+            self.executor.submit(
+                self.list_resources,
+                resource_type,
+                resource_name=resource_name,
+                owner_name=owner_name,
+                as_template=as_template,
+                status=status,
+            )
+            for resource_type in ResourceType.values()
+        ]
+        return list(chain.from_iterable(f.result() for f in futures))
+
     def get_resource(
         self,
         resource_type: str,
@@ -637,16 +845,78 @@ class SaturnConnection:
         as_template: bool = False,
     ) -> Dict[str, Any]:
         resource_type = ResourceType.lookup(resource_type)
-        url = urljoin(self.url, f"api/recipes/{resource_type}/{resource_name}")
+        url = f"{self._api_base}recipes/{resource_type}/{resource_name}"
         qparams = {}
         if owner_name:
             qparams["owner_name"] = owner_name
         if as_template:
             qparams["as_template"] = True
-        url = url + "?" + urlencode(qparams)
+        url = make_path(url, qparams)
 
-        response = self.session.get(url)
-        return response.json()
+        if as_template:
+            # Templates are usually modified by the caller, so they are never cached
+            return self._request("GET", url)
+        return self._cached_get(url, RESOURCE_CACHE_TTL)
+
+    def invalidate_resource(
+        self, resource_type: Optional[str] = None, resource_name: Optional[str] = None
+    ) -> None:
+        """
+        Drop cached API responses so the next call re-fetches them.
+        When resource_type is given only the matching recipe lookups are dropped,
+        otherwise everything cached on this connection is cleared.
+        """
+        # In-flight _cached_get calls may hold pre-mutation bodies; don't let them store those
+        self._cache_version += 1
+        if resource_type is None:
+            self._cache.clear()
+            return
+        resource_type = ResourceType.lookup(resource_type)
+        recipe_url = f"{self._api_base}recipes/{resource_type}/"
+        for key in self._cache.keys():
+            path = key.split("?", 1)[0]
+            if path.startswith(recipe_url) and (
+                resource_name is None or path == recipe_url + resource_name
+            ):
+                self._cache.pop(key)
+
+    def _cached_get(self, url: str, ttl: float, keep_etag: bool = True) -> Any:
+        """
+        GET url and return the parsed JSON response, reusing the response for ttl seconds.
+        The raw body is what gets cached, so every call returns fresh objects that the
+        caller is free to modify.
+        """
+        content = self._cache.get(url)
+        if content is None:
+            version = self._cache_version
+            content = self._conditional_get_content(url, keep_etag=keep_etag)
+            if version == self._cache_version:
+                self._cache.set(url, content, ttl)
+        return _loads(content)
+
+    def _conditional_get(self, url: str) -> Any:
+        """GET url and return the parsed JSON response, revalidating with a stored ETag"""
+        return _loads(self._conditional_get_content(url))
+
+    def _conditional_get_content(self, url: str, keep_etag: bool = True) -> bytes:
+        """
+        GET url and return the raw response body. When the server sent an ETag for a
+        previous response, it is sent back with If-None-Match and a 304 reuses that body.
+        Bodies are only kept for this when keep_etag is set, so large, fast-changing
+        responses (e.g. pod summaries carrying logs) aren't held for ETAG_CACHE_TTL.
+        """
+        headers = None
+        validator = self._etags.get(url) if keep_etag else None
+        if validator is not None:
+            headers = {"If-None-Match": validator[0]}
+        response = self.session.get(url, headers=headers)
+        if response.status_code == 304 and validator is not None:
+            return validator[1]
+        content = response.content
+        etag = response.headers.get("ETag")
+        if etag and keep_etag:
+            self._etags.set(url, (etag, content), ETAG_CACHE_TTL)
+        return content
 
     def get_logs(
         self,
@@ -676,7 +946,7 @@ class SaturnConnection:
 
         if not source or source == DataSource.LIVE:
             # Search for latest live pod
-            pods = self._get_live_pods(resource_type, resource_id)
+            pods = self._get_live_pods(resource_type, resource_id, top_only=True)
             if len(pods) > 0:
                 pod_name = pods[0]["pod_name"]
                 return self.get_logs(
@@ -690,7 +960,7 @@ class SaturnConnection:
 
         if not source or source == DataSource.HISTORICAL:
             # Search for latest historical pod
-            historical_pods = self._get_historical_pods(resource_type, resource_id)
+            historical_pods = self._get_historical_pods(resource_type, resource_id, top_only=True)
             if len(historical_pods) > 0:
                 pod_name = historical_pods[0]["pod_name"]
                 return self._get_historical_pod_logs(resource_type, resource_id, pod_name)
@@ -704,9 +974,8 @@ class SaturnConnection:
 
     def _get_historical_pod_logs(self, resource_type: str, resource_id: str, pod_name: str) -> str:
         api_name = ResourceType.get_url_name(resource_type)
-        url = urljoin(self.url, f"api/{api_name}/{resource_id}/logs?pod_name={pod_name}")
-        response = self.session.get(url)
-        result = response.json()
+        url = make_path(f"{self._api_base}{api_name}/{resource_id}/logs", {"pod_name": pod_name})
+        result = self._request("GET", url)
         return format_historical_logs(pod_name, result["logs"])
 
     def get_pods(
@@ -731,10 +1000,7 @@ class SaturnConnection:
             pods = self._get_historical_pods(resource_type, resource_id)
 
         if status:
-            if isinstance(status, str):
-                status = {status}
-            elif not isinstance(status, set):
-                status = set(status)
+            status = status_set(status)
             pods = [p for p in pods if p.get("status") in status]
         return pods
 
@@ -743,65 +1009,86 @@ class SaturnConnection:
         resource_type: str,
         resource_id: str,
     ) -> List[Dict[str, Any]]:
-        historical_pods = self._get_historical_pods(resource_type, resource_id)
+        # The two sources are independent requests, so fetch them concurrently
+        historical_future = self.executor.submit(
+            self._get_historical_pods, resource_type, resource_id, sort=False
+        )
         live_pods = self._get_live_pods(resource_type, resource_id)
-        live_pod_names = set(x["pod_name"] for x in live_pods)
+        historical_pods = historical_future.result()
+        live_pod_names = {x["pod_name"] for x in live_pods}
+        # Filter before sorting so history rows shadowed by live pods are never sorted
         historical_pods = [x for x in historical_pods if x["pod_name"] not in live_pod_names]
-        return live_pods + historical_pods
+        historical_pods.sort(key=_historical_pod_key, reverse=True)
+        live_pods.extend(historical_pods)
+        return live_pods
 
-    def _get_historical_pods(self, resource_type: str, resource_id: str) -> List[Dict[str, Any]]:
+    def _get_historical_pods(
+        self, resource_type: str, resource_id: str, top_only: bool = False, sort: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Pods from the resource's history, newest first.
+        If top_only, only the newest pod is returned. If not sort, pods are left in API order.
+        """
         api_name = ResourceType.get_url_name(resource_type)
-        url = urljoin(self.url, f"api/{api_name}/{resource_id}/history")
-        response = self.session.get(url)
-        result = response.json()["pods"]
+        url = f"{self._api_base}{api_name}/{resource_id}/history"
+        result = self._cached_get(url, POD_LIST_CACHE_TTL)["pods"]
         for p in result:
             p["source"] = "historical"
-        result = sorted(result, key=lambda x: (x["start_time"] or "", x["pod_name"]), reverse=True)
-        return result
-
-    def _get_live_pods(self, resource_type: str, resource_id: str) -> List[Dict[str, Any]]:
+        if top_only:
+            return [max(result, key=_historical_pod_key)] if result else []
+        if not sort:
+            return list(result)
+        return sorted(result, key=_historical_pod_key, reverse=True)
+
+    def _get_live_pods(
+        self, resource_type: str, resource_id: str, top_only: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Currently running pods for the resource, newest first.
+        If top_only, only the newest pod is returned.
+        """
         api_name = ResourceType.get_url_name(resource_type)
-        url = urljoin(self.url, f"api/{api_name}/{resource_id}/runtimesummary")
-        response = self.session.get(url)
-        result = response.json()
+        url = f"{self._api_base}{api_name}/{resource_id}/runtimesummary"
+        result = self._cached_get(url, POD_LIST_CACHE_TTL, keep_etag=False)
         live_pods = []
+        pod_summaries: Iterable[Dict[str, Any]]
         if "job_summaries" in result:
-            pod_summaries = reduce(
-                lambda x, y: x + y, [x.get("pod_summaries", []) for x in result["job_summaries"]]
+            # Only iterated once below, so the summaries are chained without building a list
+            pod_summaries = chain.from_iterable(
+                x.get("pod_summaries", ()) for x in result["job_summaries"]
             )
         else:
-            pod_summaries = result.get("pod_summaries", [])
+            pod_summaries = result.get("pod_summaries", ())
+        # All rows from one response share the same snapshot time
+        last_seen = utcnow()
         for pod in pod_summaries:
-            end_time = pod.get("completed_at", "")
-            start_time = pod.get("started_at", "")
-            status = pod["status"]
-            pod_name = pod["name"]
-            last_seen = utcnow()
-            row = dict(
-                end_time=end_time,
-                start_time=start_time,
-                status=status,
-                pod_name=pod_name,
-                last_seen=last_seen,
-            )
-            if pod["labels"].get("job-name"):
-                row["label_job_name"] = pod["labels"].get("job-name")
+            row = {
+                "end_time": pod.get("completed_at", ""),
+                "start_time": pod.get("started_at", ""),
+                "status": pod["status"],
+                "pod_name": pod["name"],
+                "last_seen": last_seen,
+                "source": "live",
+            }
+            job_name = pod["labels"].get("job-name")
+            if job_name:
+                row["label_job_name"] = job_name
             live_pods.append(row)
-        for p in live_pods:
-            p["source"] = "live"
-        live_pods = sorted(live_pods, key=lambda x: (x["start_time"], x["pod_name"]), reverse=True)
+        if top_only:
+            return [max(live_pods, key=_live_pod_key)] if live_pods else []
+        live_pods.sort(key=_live_pod_key, reverse=True)
         return live_pods
 
     def _get_pod_runtime_summary(
         self, pod_name: str, resource_id: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
-        url = urljoin(self.url, f"api/pod/namespace/main-namespace/name/{pod_name}/runtimesummary")
+        url = f"{self._api_base}pod/namespace/main-namespace/name/{quote(pod_name)}/runtimesummary"
         try:
-            response = self.session.get(url)
+            pod_summary = self._cached_get(url, POD_SUMMARY_CACHE_TTL, keep_etag=False)
         except SaturnHTTPError as e:
             if e.status_code == 404:
                 return None
-        pod_summary = response.json()
+            raise
 
         pod_resource_id = pod_summary.get("labels", {}).get("saturncloud.io/resource-id")
         if resource_id and pod_resource_id != resource_id:
@@ -810,56 +1097,89 @@ class SaturnConnection:
         return pod_summary
 
     def apply(self, recipe_dict: Dict[str, Any]) -> Dict[str, Any]:
-        url = urljoin(self.url, "api/recipes")
-        response = self.session.put(url, json=recipe_dict)
-        result = response.json()
+        url = f"{self._api_base}recipes"
+        result = self._request("PUT", url, json=recipe_dict)
+        self.invalidate_resource(result["type"], result["spec"]["name"])
         return result
 
     def create(self, recipe_dict: Dict[str, Any], enforce_unknown=True) -> Dict[str, Any]:
-        url = urljoin(self.url, "api/recipes")
+        url = f"{self._api_base}recipes"
         params = {"enforce_unknown": "true" if enforce_unknown else "false"}
         url = f"{url}?{urlencode(params)}"
-        response = self.session.post(url, json=recipe_dict)
-        result = response.json()
+        result = self._request("POST", url, json=recipe_dict)
+        self.invalidate_resource(result["type"], result["spec"]["name"])
         return result
 
+    def apply_many(
+        self, recipe_dicts: List[Dict[str, Any]], max_workers: int = 8
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Apply several recipes concurrently over the shared session.
+
+        Results are returned in the order of recipe_dicts. A recipe that fails yields
+        its exception in place of a result instead of aborting the rest of the batch.
+        """
+
+        def apply_one(recipe_dict: Dict[str, Any]) -> Union[Dict[str, Any], Exception]:
+            try:
+                return self.apply(recipe_dict)
+            except Exception as e:
+                return e
+
+        # Runs on the shared executor (apply never submits to it, so this can't deadlock),
+        # with at most max_workers in flight. More than the pooled connections would only
+        # queue for a connection.
+        in_flight = threading.BoundedSemaphore(max(1, min(max_workers, self.settings.POOL_MAXSIZE)))
+        futures = []
+        for recipe_dict in recipe_dicts:
+            in_flight.acquire()
+            future = self.executor.submit(apply_one, recipe_dict)
+            future.add_done_callback(lambda _: in_flight.release())
+            futures.append(future)
+        return [future.result() for future in futures]
+
     def start(self, resource_type: str, resource_id: str, debug_mode: bool = False):
         url_name = ResourceType.get_url_name(resource_type)
-        url = urljoin(self.url, f"api/{url_name}/{resource_id}/start")
+        url = f"{self._api_base}{url_name}/{resource_id}/start"
         data = {"debug_mode": True} if debug_mode else None
-        response = self.session.post(url, json=data)
-        return response.json()
+        result = self._request("POST", url, json=data)
+        self.invalidate_resource()
+        return result
 
     def delete(self, resource_type: str, resource_id: str, debug_mode: bool = False):
         url_name = ResourceType.get_url_name(resource_type)
-        url = urljoin(self.url, f"api/{url_name}/{resource_id}")
+        url = f"{self._api_base}{url_name}/{resource_id}"
         response = self.session.delete(url)
+        self.invalidate_resource()
         return response.status_code
 
     def stop(self, resource_type: str, resource_id: str):
         url_name = ResourceType.get_url_name(resource_type)
-        url = urljoin(self.url, f"api/{url_name}/{resource_id}/stop")
+        url = f"{self._api_base}{url_name}/{resource_id}/stop"
         self.session.post(url)
+        self.invalidate_resource()
 
     def restart(self, resource_type: str, resource_id: str, debug_mode: bool = False):
         url_name = ResourceType.get_url_name(resource_type)
-        url = urljoin(self.url, f"api/{url_name}/{resource_id}/restart")
+        url = f"{self._api_base}{url_name}/{resource_id}/restart"
         data = {"debug_mode": True} if debug_mode else None
-        response = self.session.post(url, json=data)
-        return response.json()
+        result = self._request("POST", url, json=data)
+        self.invalidate_resource()
+        return result
 
     def schedule(self, job_id: str, cron_schedule: Optional[str] = None, disable: bool = False):
         url_name = ResourceType.get_url_name(ResourceType.JOB)
-        base_url = urljoin(self.url, f"api/{url_name}/{job_id}")
+        base_url = f"{self._api_base}{url_name}/{job_id}"
         if cron_schedule:
-            response = self.session.patch(
+            self.session.patch(
                 base_url,
                 json={"cron_schedule_options": {"schedule": cron_schedule}},
             )
 
-        url = urljoin(f"{base_url}/", "unschedule" if disable else "schedule")
-        response = self.session.post(url)
-        return response.json()
+        url = f"{base_url}/unschedule" if disable else f"{base_url}/schedule"
+        result = self._request("POST", url)
+        self.invalidate_resource()
+        return result
 
     def clone(
         self,
@@ -920,9 +1240,9 @@ class SaturnConnection:
             "website_url": website_url,
             "limits_id": limits_id,
         }
-        url = urljoin(self.url, "api/orgs")
-        response = self.session.post(url, json=payload)
-        result = response.json()
+        url = f"{self._api_base}orgs"
+        result = self._request("POST", url, json=payload)
+        self.invalidate_user_cache()
         return result
 
     def update_organization(
@@ -943,18 +1263,19 @@ class SaturnConnection:
         }
         payload = {k: v for k, v in payload.items() if v is not None}
 
-        url = urljoin(self.url, f"api/orgs/{org_id}")
-        response = self.session.patch(url, json=payload)
-        result = response.json()
+        url = f"{self._api_base}orgs/{org_id}"
+        result = self._request("PATCH", url, json=payload)
+        self.invalidate_user_cache()
         return result
 
     def add_orgmember(self, org_id: str, user_id: str) -> Dict:
-        url = urljoin(self.url, f"api/orgs/{org_id}/members")
+        url = f"{self._api_base}orgs/{org_id}/members"
         payload = {
             "user_id": user_id,
         }
-        response = self.session.post(url, json=payload)
-        return response.json()
+        result = self._request("POST", url, json=payload)
+        self.invalidate_user_cache()
+        return result
 
     def invite(
         self, org_id: str, email: str, invitee_name: str, invitor_name: str, send_email: bool = True
@@ -965,10 +1286,9 @@ class SaturnConnection:
             "invitor_name": invitor_name,
         }
         params = urlencode({"send_email": "true" if send_email else "false"})
-        url = urljoin(self.url, f"api/orgs/{org_id}/invitations?")
+        url = f"{self._api_base}orgs/{org_id}/invitations"
         url = f"{url}?{params}"
-        response = self.session.post(url, json=payload)
-        result = response.json()
+        result = self._request("POST", url, json=payload)
         return result
 
 
@@ -981,8 +1301,27 @@ class SaturnSession(requests.Session):
     def __init__(self, settings: Settings) -> None:
         super().__init__()
         self.settings = settings
+        self._token_url = urljoin(self.settings.BASE_URL, "api/auth/token")
+        # Refresh tokens are single use, so concurrent requests must not refresh twice
+        self._refresh_lock = threading.Lock()
 
         self.headers.update(self.settings.headers)
+        self.headers["Accept-Encoding"] = "gzip, deflate"
+
+        # Keep connections to the Saturn host alive between calls, and retry idempotent
+        # requests when a gateway in front of the API is briefly unavailable.
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=self.settings.POOL_MAXSIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False,
+            ),
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
 
         if "response" in self.hooks:
             response_hooks = self.hooks["response"]
@@ -996,7 +1335,8 @@ class SaturnSession(requests.Session):
         self, response: requests.Response, *args, **kwargs
     ) -> Optional[requests.Response]:
         if not response.ok:
-            if self._should_refresh(response) and self._refresh():
+            stale_auth = response.request.headers.get("Authorization")
+            if self._should_refresh(response) and self._refresh(stale_auth):
                 response.request.headers.update(self.headers)
                 response.request.headers["X-Saturn-Retry"] = "true"
                 return self.send(response.request)
@@ -1011,22 +1351,29 @@ class SaturnSession(requests.Session):
 
         if response.status_code == 401:
             try:
-                return "expired" in response.json()["message"]
+                return "expired" in _loads(response.content)["message"]
             except Exception:
                 return False
         return False
 
-    def _refresh(self) -> bool:
-        if self.settings.REFRESH_TOKEN:
-            url = urljoin(self.settings.BASE_URL, "api/auth/token")
-            data = {"grant_type": "refresh_token", "refresh_token": self.settings.REFRESH_TOKEN}
-            # Intentionally not using the current session here
-            response = requests.post(url, json=data, hooks={})
-            if response.ok:
-                token_data: Dict[str, Any] = response.json()
-                self.settings.update_tokens(
-                    token_data["access_token"], token_data.get("refresh_token")
-                )
-                self.headers.update(self.settings.headers)
+    def _refresh(self, stale_auth: Optional[str] = None) -> bool:
+        with self._refresh_lock:
+            if stale_auth is not None and self.headers.get("Authorization") != stale_auth:
+                # Another thread already refreshed since this request was sent
                 return True
-        return False
+            if self.settings.REFRESH_TOKEN:
+                url = self._token_url
+                data = {
+                    "grant_type": "refresh_token",
+                    "refresh_token": self.settings.REFRESH_TOKEN,
+                }
+                # Intentionally not using the current session here
+                response = requests.post(url, json=data, hooks={})
+                if response.ok:
+                    token_data: Dict[str, Any] = _loads(response.content)
+                    self.settings.update_tokens(
+                        token_data["access_token"], token_data.get("refresh_token")
+                    )
+                    self.headers.update(self.settings.headers)
+                    return True
+            return False
@@ -1,13 +1,22 @@
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, List, Optional, Sequence
+
+_WIDTH = 100
+_POD_RULE = "=" * _WIDTH
+_CONTAINER_RULE = "-" * _WIDTH
+# Shared default for missing summary lists, so lookups don't allocate
+_EMPTY: tuple = ()
 
 
 def format_logs(pod_summary: Dict[str, Any], all_containers: bool = False) -> str:
-    containers: List[Dict[str, Any]] = []
-    init_container_summaries: List[Dict[str, Any]] = pod_summary.get("init_container_summaries", [])
-    container_summaries: List[Dict[str, Any]] = pod_summary.get("container_summaries", [])
+    containers: Sequence[Dict[str, Any]] = _EMPTY
+    init_container_summaries: Sequence[Dict[str, Any]] = (
+        pod_summary.get("init_container_summaries") or _EMPTY
+    )
+    container_summaries: Sequence[Dict[str, Any]] = pod_summary.get("container_summaries") or _EMPTY
     if all_containers:
-        containers.extend(init_container_summaries)
-        containers.extend(container_summaries)
+        containers = [*init_container_summaries, *container_summaries]
     else:
         # Find the main container
         for container in container_summaries:
@@ -22,17 +31,23 @@ def format_logs(pod_summary: Dict[str, Any], all_containers: bool = False) -> st
         if all(c.get("status") == "waiting" for c in containers):
             containers = init_container_summaries
 
-    container_logs = []
+    # Collect every piece of output and join once at the end, so large container logs
+    # are copied a single time rather than once per nested section
+    parts = [f"Pod: {pod_summary['name']}", "\n", _POD_RULE, "\n"]
+    body_start = len(parts)
     for container in containers:
         previous_container = container.get("previous")
         if previous_container:
-            container_logs.append(format_container_logs(previous_container, is_previous=True))
-        container_logs.append(format_container_logs(container))
+            if len(parts) > body_start:
+                parts.append("\n\n")
+            _append_container_logs(parts, previous_container, is_previous=True)
+        if len(parts) > body_start:
+            parts.append("\n\n")
+        _append_container_logs(parts, container)
 
-    logs = "\n\n".join(container_logs)
-    if not logs:
-        logs = f"Status: {pod_summary['status']}"
-    return _section_header(f"Pod: {pod_summary['name']}", logs)
+    if len(parts) == body_start:
+        parts.append(f"Status: {pod_summary['status']}")
+    return "".join(parts)
 
 
 def is_live(pod_summary: Optional[Dict[str, Any]]) -> bool:
@@ -50,17 +65,27 @@ def is_live(pod_summary: Optional[Dict[str, Any]]) -> bool:
 
 
 def has_logs(pod_summary: Dict[str, Any]) -> bool:
-    containers = pod_summary.get("container_summaries", [])
-    if any(c.get("logs") for c in containers):
-        return True
-
-    init_containers = pod_summary.get("init_container_summaries", [])
-    return any(c.get("logs") for c in init_containers)
+    containers = chain(
+        pod_summary.get("container_summaries") or _EMPTY,
+        pod_summary.get("init_container_summaries") or _EMPTY,
+    )
+    return any(c.get("logs") for c in containers)
 
 
 def format_container_logs(
     container_summary: Dict[str, Any], is_previous: bool = False, is_init: bool = False
 ) -> str:
+    parts: List[str] = []
+    _append_container_logs(parts, container_summary, is_previous=is_previous, is_init=is_init)
+    return "".join(parts)
+
+
+def _append_container_logs(
+    parts: List[str],
+    container_summary: Dict[str, Any],
+    is_previous: bool = False,
+    is_init: bool = False,
+) -> None:
     label = ""
     if is_previous:
         label = " (previous)"
@@ -68,23 +93,32 @@ def format_container_logs(
     if not logs:
         logs = f"Status: {container_summary['status']}"
     header = "Container" if not is_init else "Init Container"
-    logs = _section_header(f"{header}: {container_summary['name']}{label}", logs, char="-")
+    parts.extend(
+        [f"{header}: {container_summary['name']}{label}", "\n", _CONTAINER_RULE, "\n", logs]
+    )
     finished_at = container_summary.get("finished_at")
     if finished_at:
-        finished_at = container_summary["finished_at"]
         exit_code = container_summary.get("exit_code")
-        logs = _format_terminated(logs, finished_at, exit_code=exit_code)
-    return logs
+        parts.append("\n")
+        parts.append(_terminated_marker(finished_at, exit_code=exit_code))
 
 
 def format_historical_logs(pod_name: str, logs: str) -> str:
-    logs = _section_header("Historical", logs, char="-")
-    return _section_header(f"Pod: {pod_name}", logs)
+    # Joined once so large log bodies are only copied a single time
+    return "\n".join(
+        [
+            f"Pod: {pod_name}",
+            _POD_RULE,
+            "Historical",
+            _CONTAINER_RULE,
+            logs,
+        ]
+    )
 
 
-def _format_terminated(
-    logs: str, end_time: str, exit_code: Optional[int] = None, width: int = 100
-) -> str:
+# The same finished container is formatted again on every log poll
+@lru_cache(maxsize=64)
+def _terminated_marker(end_time: str, exit_code: Optional[int] = None, width: int = _WIDTH) -> str:
     info = ""
     if exit_code is not None:
         info = f"{exit_code} "
@@ -93,18 +127,6 @@ def _format_terminated(
     width -= len(footer)
     if width < 0:
         width = 0
-    marker = "=" * int(width / 2)
-    end_marker = marker
-    if width % 2 == 1:
-        end_marker += "="
-    return f"{logs}\n{marker}{footer}{end_marker}"
-
-
-def _section_header(label: str, content: str = "", char: str = "=", width: int = 100):
-    return "\n".join(
-        [
-            label,
-            (char * width),
-            content,
-        ]
-    )
+    marker = "=" * (width // 2)
+    end_marker = marker + "=" if width & 1 else marker
+    return f"{marker}{footer}{end_marker}"
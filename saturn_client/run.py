@@ -1,25 +1,58 @@
+import codecs
 import json
+import selectors
+import shlex
 import subprocess
 import sys
+import threading
+import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor, Future
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor, Future, wait
+from dataclasses import dataclass
 
 from os.path import join, exists
 import os
-from tempfile import NamedTemporaryFile
-from typing import List, Dict, Tuple, Optional
+from typing import Any, BinaryIO, List, Dict, Tuple, Optional, Union
 
 import click
 import fsspec
 from cytoolz import partition_all
 from fsspec.generic import GenericFileSystem
-import fsspec.generic
+from fsspec.utils import get_protocol
 from saturnfs.client.saturnfs import _rsync
 
 from saturn_client import SaturnConnection
 from saturn_client.settings import Settings
 
+try:
+    from orjson import dumps as _dumps
+except ImportError:
+    # orjson is an optional, faster drop-in for writing batch files
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+
+# Upper bound on bytes copied from one pipe per wake of the dispatch loop
+READ_MAX_BYTES = 4 << 20
+# Remote log output is buffered and written once this much is pending, or once
+# REMOTE_WRITE_SECONDS have passed, so slow output still reaches the remote file
+REMOTE_WRITE_BYTES = 256 << 10
+REMOTE_WRITE_SECONDS = 10.0
+# Concurrent reads used to gather run status from sync filesystems
+CAT_MAX_WORKERS = 32
+# Concurrent writes used by split for batch files
+WRITE_MAX_WORKERS = 32
+# Protocols of flat object stores, where creating a directory is unnecessary
+OBJECT_STORE_PROTOCOLS = frozenset({"s3", "s3a", "gs", "gcs", "abfs", "az", "sfs"})
+# Characters that need /bin/sh to interpret (quotes are handled by shlex the same way)
+_SHELL_CHARS = frozenset("|&;<>()$`\\*?[]{}~#!\n")
+# Builtins and keywords that only exist inside a shell
+_SHELL_WORDS = frozenset(
+    ". : alias break case cd command continue eval exec exit export for if read readonly return "
+    "set shift source time trap ulimit umask unalias unset until wait while".split()
+)
+
 
 @dataclass
 class Run:
@@ -59,53 +92,298 @@ class RunStatus:
     ERROR = "error"
 
 
-def dispatch_thread(cmd: str, remote_output_path: str, local_results_dir: str) -> None:
+_fs: Optional[GenericFileSystem] = None
+_fs_lock = threading.Lock()
+
+
+def _get_fs() -> GenericFileSystem:
+    """GenericFileSystem shared by every run in this process"""
+    global _fs
+    if _fs is None:
+        with _fs_lock:
+            if _fs is None:
+                _fs = GenericFileSystem()
+    return _fs
+
+
+_pools: Dict[int, ThreadPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def _log_max_bytes() -> Optional[int]:
+    """
+    Optional cap on the size of each remote stdout/stderr log, from
+    SATURN_RUN_LOG_MAX_BYTES. Output past it is dropped.
+    """
+    log_max_bytes = os.getenv("SATURN_RUN_LOG_MAX_BYTES")
+    if not log_max_bytes:
+        return None
+    try:
+        return int(log_max_bytes) or None
+    except ValueError as err:
+        err_msg = f'"{log_max_bytes}" is not a valid SATURN_RUN_LOG_MAX_BYTES'
+        raise ValueError(err_msg) from err
+
+
+def _get_pool(nprocs: int) -> ThreadPoolExecutor:
+    """
+    Pool of nprocs workers reused by every batch() with the same nprocs, so repeated
+    batches don't start and join a fresh set of threads. Pools are never shared between
+    sizes, so nprocs still bounds how many runs execute at once.
+    """
+    with _pools_lock:
+        pool = _pools.get(nprocs)
+        if pool is None:
+            pool = _pools[nprocs] = ThreadPoolExecutor(nprocs, thread_name_prefix="saturn-run")
+    return pool
+
+
+def _ensure_remote_dir(path: str) -> None:
+    """
+    Creates the directory path if its filesystem has directories. Object stores have no
+    real directories, so nothing is sent for them.
+    """
+    if get_protocol(path) in OBJECT_STORE_PROTOCOLS:
+        return
+    _get_fs().makedirs(path, exist_ok=True)
+
+
+def _open_pidfd(pid: int) -> Optional[int]:
+    """
+    Returns a file descriptor that becomes readable when the process exits, or None
+    where pidfds are unavailable (non-Linux, Python < 3.9 or kernel < 5.3).
+    """
+    try:
+        return os.pidfd_open(pid)
+    except (AttributeError, OSError):
+        return None
+
+
+def _drain(fd: int, outputs: Tuple[BinaryIO, ...], limit: Optional[int] = READ_MAX_BYTES) -> bool:
+    """
+    Copies what is currently available on the non-blocking fd to each of outputs, stopping
+    after limit bytes so one chatty stream can't starve the other. Returns False once the
+    fd reaches EOF.
+    """
+    copied = 0
+    while limit is None or copied < limit:
+        try:
+            chunk = os.read(fd, 65536)
+        except BlockingIOError:
+            break
+        if not chunk:
+            return False
+        copied += len(chunk)
+        for f in outputs:
+            f.write(chunk)
+    for f in outputs:
+        f.flush()
+    return True
+
+
+class _RemoteLog:
+    """
+    Buffers writes to the remote log file f and passes them on once REMOTE_WRITE_BYTES
+    are pending or REMOTE_WRITE_SECONDS have passed, so the remote file sees a few large
+    writes rather than one per wake. Past max_bytes, output is counted and dropped and
+    close() records how much.
+    """
+
+    def __init__(self, f: BinaryIO, max_bytes: Optional[int]):
+        self.f = f
+        self.max_bytes = max_bytes
+        self.written = 0
+        self.buffer = bytearray()
+        self.last_sent = time.monotonic()
+
+    def write(self, data: bytes) -> None:
+        if self.max_bytes is not None:
+            room = self.max_bytes - self.written
+            self.written += len(data)
+            if room <= 0:
+                return
+            data = data[:room]
+        self.buffer += data
+        if len(self.buffer) >= REMOTE_WRITE_BYTES:
+            self._send()
+
+    def flush(self) -> None:
+        if time.monotonic() - self.last_sent >= REMOTE_WRITE_SECONDS:
+            self._send()
+
+    def close(self) -> None:
+        self._send()
+        if self.max_bytes is not None and self.written > self.max_bytes:
+            dropped = self.written - self.max_bytes
+            self.f.write(f"\n...[truncated {dropped} bytes]...\n".encode())
+
+    def _send(self) -> None:
+        if self.buffer:
+            self.f.write(self.buffer)
+            self.f.flush()
+            self.buffer.clear()
+        self.last_sent = time.monotonic()
+
+
+class _LocalEcho:
+    """
+    Echoes a child's raw output to the text stream stream. Bytes go to stream.buffer when
+    there is one, after flushing the text layer so earlier print/click.echo output comes
+    first. Streams without a buffer (Jupyter, pytest capture, StringIO) get decoded text.
+    """
+
+    def __init__(self, stream: Any):
+        self.stream = stream
+        self.buffer = getattr(stream, "buffer", None)
+        self.decoder = None
+        if self.buffer is None:
+            encoding = getattr(stream, "encoding", None) or "utf-8"
+            self.decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        stream.flush()
+
+    def write(self, data: bytes) -> None:
+        if self.decoder is not None:
+            self.stream.write(self.decoder.decode(data))
+            return
+        self.stream.flush()
+        self.buffer.write(data)
+
+    def flush(self) -> None:
+        if self.buffer is not None:
+            self.buffer.flush()
+        else:
+            self.stream.flush()
+
+    def close(self) -> None:
+        if self.decoder is not None:
+            self.stream.write(self.decoder.decode(b"", final=True))
+            self.stream.flush()
+
+
+def _command_argv(cmd: str) -> Optional[List[str]]:
+    """
+    Returns cmd split into arguments when it is a plain command that can be executed
+    directly, or None when it needs a shell (expansions, redirects, builtins, ...)
+    """
+    if _SHELL_CHARS.intersection(cmd):
+        return None
+    try:
+        argv = shlex.split(cmd)
+    except ValueError:
+        return None
+    if not argv or argv[0] in _SHELL_WORDS or "=" in argv[0]:
+        return None
+    return argv
+
+
+def _spawn(cmd: str, env: Dict[str, str]) -> subprocess.Popen:
+    """
+    Starts cmd with its stdout and stderr on pipes. Plain commands are executed directly,
+    saving the fork and exec of /bin/sh for every run.
+    """
+    kwargs: Dict[str, Any] = dict(
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=0,
+        env=env,
+        # Descriptors Python opens are non-inheritable anyway (PEP 446), so skip
+        # closing every descriptor in the child on each spawn
+        close_fds=False,
+    )
+    argv = _command_argv(cmd)
+    if argv is not None:
+        try:
+            return subprocess.Popen(argv, **kwargs)
+        except OSError:
+            # e.g. command not found; let the shell report it and exit as it would
+            pass
+    return subprocess.Popen(cmd, shell=True, **kwargs)
+
+
+def dispatch_thread(
+    cmd: str,
+    remote_output_path: str,
+    local_results_dir: str,
+    base_env: Optional[Dict[str, str]] = None,
+) -> None:
+    log_max_bytes = _log_max_bytes()
     output_path = remote_output_path
     os.makedirs(local_results_dir, exist_ok=True)
-    fs = fsspec.generic.GenericFileSystem()
     remote_results_dir = join(output_path, "results/")
-    if not fs.exists(remote_results_dir):
-        fs.makedirs(remote_results_dir)
+    _ensure_remote_dir(remote_results_dir)
     remote_status_code_path = join(output_path, "status_code")
     stdout_remote = join(output_path, "stdout")
     stderr_remote = join(output_path, "stderr")
     stdout = sys.stdout
     stderr = sys.stderr
-    env = os.environ.copy()
-    env["SATURN_RUN_REMOTE_OUTPUT_PATH"] = remote_output_path
-    env["SATURN_RUN_LOCAL_RESULTS_DIR"] = local_results_dir
+    env = {
+        **(os.environ if base_env is None else base_env),
+        "SATURN_RUN_REMOTE_OUTPUT_PATH": remote_output_path,
+        "SATURN_RUN_LOCAL_RESULTS_DIR": local_results_dir,
+    }
+    if env.get("SATURN_RUN_UNBUFFERED") and "PYTHONUNBUFFERED" not in env:
+        # Opt-in: Python children see a pipe and otherwise hold output back in 8 KiB blocks
+        env["PYTHONUNBUFFERED"] = "1"
+    exitcode = None
+    pidfd = None
+    sel = None
     try:
-        stdout_local_f = NamedTemporaryFile("w+t", buffering=1)
-        stderr_local_f = NamedTemporaryFile("w+t", buffering=1)
-        stdout_local_r = open(stdout_local_f.name)
-        stderr_local_r = open(stderr_local_f.name)
-        exitcode = None
-        with stdout_local_f, stderr_local_f, stdout_local_r, stderr_local_r, fsspec.open(
-            stdout_remote, "wt"
-        ) as stdout_remote_f, fsspec.open(stderr_remote, "wt") as stderr_remote_f:
-            proc = subprocess.Popen(
-                cmd, stdout=stdout_local_f, stderr=stderr_local_f, shell=True, env=env
-            )
-            while True:
-                try:
-                    exitcode = proc.wait(1)
-                except subprocess.TimeoutExpired:
-                    pass
-                stdout_local_f.flush()
-                stderr_local_f.flush()
-                _ = stdout_local_r.read()
-                stdout_remote_f.write(_)
-                sys.stdout.write(_)
-                _ = stderr_local_r.read()
-                stderr_remote_f.write(_)
-                sys.stderr.write(_)
-
-                if exitcode is not None:
-                    break
-
+        with fsspec.open(stdout_remote, "wb") as stdout_remote_f, fsspec.open(
+            stderr_remote, "wb"
+        ) as stderr_remote_f:
+            proc = _spawn(cmd, env)
+            stdout_log = _RemoteLog(stdout_remote_f, log_max_bytes)
+            stderr_log = _RemoteLog(stderr_remote_f, log_max_bytes)
+            stdout_echo = _LocalEcho(stdout)
+            stderr_echo = _LocalEcho(stderr)
+            outputs = {
+                proc.stdout.fileno(): (stdout_log, stdout_echo),
+                proc.stderr.fileno(): (stderr_log, stderr_echo),
+            }
+            for fd in outputs:
+                os.set_blocking(fd, False)
+            open_fds = set(outputs)
+            # Sleep on both pipes, and on the pidfd where available, so the loop wakes as
+            # soon as there is output or the child exits
+            sel = selectors.DefaultSelector()
+            for fd in outputs:
+                sel.register(fd, selectors.EVENT_READ)
+            pidfd = _open_pidfd(proc.pid)
+            if pidfd is not None:
+                sel.register(pidfd, selectors.EVENT_READ)
+            while exitcode is None:
+                if sel.get_map():
+                    ready = [key.fd for key, _ in sel.select(1)]
+                    if pidfd is None or pidfd in ready:
+                        exitcode = proc.poll()
+                else:
+                    ready = []
+                    try:
+                        exitcode = proc.wait(1)
+                    except subprocess.TimeoutExpired:
+                        pass
+                for fd in ready:
+                    if fd in open_fds and not _drain(fd, outputs[fd]):
+                        open_fds.discard(fd)
+                        sel.unregister(fd)
+                # send output that has been pending too long, even if the child went quiet
+                stdout_log.flush()
+                stderr_log.flush()
+            # Pick up everything written between the last wake and the exit. Don't wait
+            # for EOF, since background processes the command started may hold the pipes.
+            for fd in open_fds:
+                _drain(fd, outputs[fd], limit=None)
+            stdout_log.close()
+            stderr_log.close()
+            stdout_echo.close()
+            stderr_echo.close()
+            proc.stdout.close()
+            proc.stderr.close()
     finally:
-        stdout.echo = None
-        stderr.echo = None
+        if sel is not None:
+            sel.close()
+        if pidfd is not None:
+            os.close(pidfd)
         if exists(local_results_dir):
             _rsync(local_results_dir, remote_results_dir)
         with fsspec.open(remote_status_code_path, "w") as f:
@@ -116,35 +394,75 @@ def batch(input_dict: Dict) -> None:
     batch = Batch.from_dict(input_dict)
     nprocs = batch.nprocs
     futures: List[Future] = []
-    with ThreadPoolExecutor(nprocs) as pool:
-        for run in batch.runs:
-            fut = pool.submit(
-                dispatch_thread, run.cmd, run.remote_output_path, run.local_results_dir
-            )
-            futures.append(fut)
-        for fut in futures:
-            fut.result()
+    # Snapshot the environment once rather than copying os.environ for every run
+    base_env = dict(os.environ)
+    pool = _get_pool(nprocs)
+    for run in batch.runs:
+        fut = pool.submit(
+            dispatch_thread, run.cmd, run.remote_output_path, run.local_results_dir, base_env
+        )
+        futures.append(fut)
+    # Let every run finish before surfacing the first failure, as the per-call pool did
+    wait(futures)
+    for fut in futures:
+        fut.result()
+
+
+def _cat_files(fs: GenericFileSystem, paths: List[str]) -> List[Union[bytes, Exception]]:
+    """
+    Reads many small files, returning the error in place of the contents for any file that
+    can't be read. Paths are grouped by protocol and each group is read through its own
+    filesystem. GenericFileSystem.cat_ranges reads them concurrently when that filesystem is
+    async (s3, gcs, ...) but one at a time otherwise, so reads from sync filesystems go
+    through a thread pool instead.
+    """
+    by_protocol: Dict[str, List[int]] = {}
+    for i, path in enumerate(paths):
+        by_protocol.setdefault(get_protocol(path), []).append(i)
+    results: Dict[int, Union[bytes, Exception]] = {}
+    for indices in by_protocol.values():
+        group = [paths[i] for i in indices]
+        results.update(zip(indices, _cat_same_fs(fs, group)))
+    return [results[i] for i in range(len(paths))]
+
+
+def _cat_same_fs(fs: GenericFileSystem, paths: List[str]) -> List[Union[bytes, Exception]]:
+    """_cat_files for paths that all share one protocol"""
+    target, _ = fsspec.core.url_to_fs(paths[0])
+    if target.async_impl or len(paths) < 2:
+        return fs.cat_ranges(paths, 0, None, on_error="return")
+
+    def cat(path: str) -> Union[bytes, Exception]:
+        try:
+            return target.cat_file(path)
+        except Exception as err:
+            return err
+
+    with ThreadPoolExecutor(min(CAT_MAX_WORKERS, len(paths))) as pool:
+        return list(pool.map(cat, paths))
 
 
 def categorize_runs(
     remote_output_path: str, runs: List[Run]
 ) -> Tuple[List[Run], List[Run], List[Run]]:
-    fs = GenericFileSystem()
+    fs = _get_fs()
     if not remote_output_path.endswith("/"):
         remote_output_path += "/"
     click.echo(f"gathering existing run status from {remote_output_path}")
-    status_code_files = fs.glob(f"{remote_output_path}*/status_code")
-    status_codes = fs.cat_ranges(status_code_files, 0, None)
-    mapping = dict(zip(status_code_files, status_codes))
+    # Read each run's own status file, wherever its output lives; a missing file means
+    # the run hasn't finished
+    status_code_files = [join(r.remote_output_path, "status_code") for r in runs]
+    status_codes = _cat_files(fs, status_code_files)
     incomplete = []
     completed = []
     failures = []
-    for r in runs:
-        status_code_path = join(r.remote_output_path, "status_code")
-        if status_code_path not in mapping:
+    for r, result in zip(runs, status_codes):
+        if isinstance(result, FileNotFoundError):
             incomplete.append(r)
             continue
-        status_code = int(mapping[status_code_path])
+        if isinstance(result, Exception):
+            raise result
+        status_code = int(result)
         r.status_code = status_code
         if status_code == 0:
             r.status = RunStatus.COMPLETED
@@ -200,18 +518,25 @@ def split(
     else:
         batch_size_int = batch_size
         click.echo(f"using a batch size of {batch_size_int}")
-    chunks = partition_all(batch_size_int, to_execute)
-    output_batch_files = []
+    chunks = list(partition_all(batch_size_int, to_execute))
+    output_batch_files = [
+        join(remote_commands_directory, f"{idx}.json") for idx in range(len(chunks))
+    ]
     os.makedirs(local_commands_directory, exist_ok=True)
-    for idx, chunk in enumerate(chunks):
-        fpath = join(local_commands_directory, f"{idx}.json")
-        remote_fpath = join(remote_commands_directory, f"{idx}.json")
-        sub = Batch(
-            nprocs=batch.nprocs, runs=list(chunk), remote_output_path=batch.remote_output_path
-        )
-        with open(fpath, "w+") as f:
-            json.dump(asdict(sub), f)
-        output_batch_files.append(remote_fpath)
+
+    def write_chunk(idx: int, chunk: Tuple[Run, ...]) -> None:
+        # Same layout as asdict(Batch(...)), without asdict's recursive deep copy
+        sub = {
+            "runs": [vars(r) for r in chunk],
+            "remote_output_path": batch.remote_output_path,
+            "nprocs": batch.nprocs,
+        }
+        with open(join(local_commands_directory, f"{idx}.json"), "wb") as f:
+            f.write(_dumps(sub))
+
+    # The files are independent, so write them concurrently
+    with ThreadPoolExecutor(max(1, min(WRITE_MAX_WORKERS, len(chunks)))) as pool:
+        list(pool.map(write_chunk, range(len(chunks)), chunks))
     recipe["spec"]["command"] = [f"sc batch {x}" for x in output_batch_files]
 
 
@@ -222,7 +547,8 @@ def setup_file_syncs(recipe: Dict, sync: List[str]) -> None:
     working_directory = recipe["spec"].get("working_directory", Settings.WORKING_DIRECTORY)
     resource_name = recipe["spec"].get("name")
     client = SaturnConnection()
-    for s in sync:
+
+    def upload(s: str) -> List[str]:
         if ":" in s:
             source, dest = s.split(":")
         else:
@@ -236,12 +562,15 @@ def setup_file_syncs(recipe: Dict, sync: List[str]) -> None:
         click.echo(f"syncing {source}")
         sfs_path = client.upload_source(source, resource_name, dest)
         click.echo(f"synced {source} to {sfs_path}")
-        cmd = f"saturnfs cp {sfs_path} /tmp/data.tar.gz"
-        commands.append(cmd)
-        cmd = f"mkdir -p {dest}"
-        commands.append(cmd)
-        cmd = f"tar -xvzf /tmp/data.tar.gz -C {dest}"
-        commands.append(cmd)
+        return [
+            f"saturnfs cp {sfs_path} /tmp/data.tar.gz",
+            f"mkdir -p {dest}",
+            f"tar -xvzf /tmp/data.tar.gz -C {dest}",
+        ]
+
+    # Uploads are independent, so run them concurrently; map keeps the commands in order
+    for sync_commands in client.executor.map(upload, sync):
+        commands.extend(sync_commands)
     start_script = recipe["spec"].get("start_script", "")
     starting_index = start_script.find(START_STRING)
     ending_index = start_script.find(END_STRING)
@@ -19,6 +19,8 @@ class Settings:
     SATURN_TOKEN: str
     REFRESH_TOKEN: Optional[str] = None
     WORKING_DIRECTORY: str = "/home/jovyan/workspace"
+    # Max keep-alive connections held open to the Saturn host for concurrent requests
+    POOL_MAXSIZE: int = 20
 
     def __init__(
         self,
@@ -53,6 +55,16 @@ class Settings:
         else:
             self.REFRESH_TOKEN = os.getenv("SATURN_REFRESH_TOKEN")
 
+        pool_maxsize = os.getenv("SATURN_CLIENT_POOL_MAXSIZE")
+        if pool_maxsize:
+            try:
+                self.POOL_MAXSIZE = int(pool_maxsize)
+                if self.POOL_MAXSIZE < 1:
+                    raise ValueError(pool_maxsize)
+            except ValueError as err:
+                err_msg = f'"{pool_maxsize}" is not a valid SATURN_CLIENT_POOL_MAXSIZE'
+                raise ValueError(err_msg) from err
+
     def update_tokens(self, access_token: str, refresh_token: Optional[str] = None):
         self.SATURN_TOKEN = access_token
         if "SATURN_TOKEN" in os.environ:
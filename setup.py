@@ -4,6 +4,7 @@ from setuptools import setup, find_packages
 import versioneer
 
 install_requires = ["requests", "fsspec>=2024.2", "saturnfs", "ruamel.yaml", "cytoolz"]
+extras_require = {"orjson": ["orjson"]}
 
 
 setup(
@@ -41,5 +42,6 @@ setup(
     },
     packages=find_packages(),
     install_requires=install_requires,
+    extras_require=extras_require,
     zip_safe=False,
 )